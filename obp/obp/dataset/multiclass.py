@@ -3,18 +3,149 @@
 
 """Class for Multi-Class Classification to Bandit Reduction."""
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import numpy as np
-from scipy.stats import rankdata
+from scipy.sparse import issparse
 from sklearn.base import ClassifierMixin, is_classifier, clone
 from sklearn.model_selection import train_test_split
-from sklearn.utils import check_random_state, check_X_y
+from sklearn.utils import check_X_y
 
 from .base import BaseBanditDataset
 from ..types import BanditFeedback
 
 
+def _get_rng(
+    random_state: Optional[Union[int, np.random.RandomState, np.random.Generator]]
+) -> Union[np.random.RandomState, np.random.Generator]:
+    """Turn a seed into a `np.random.Generator` (given random number generators are returned as is)."""
+    if isinstance(random_state, (np.random.RandomState, np.random.Generator)):
+        return random_state
+    return np.random.default_rng(random_state)
+
+
+def _is_same_params(params: Dict[str, Any], cached_params: Dict[str, Any]) -> bool:
+    """Check whether two outputs of `get_params` hold the same parameter values (without pickling them)."""
+    if params.keys() != cached_params.keys():
+        return False
+    for key, value in params.items():
+        cached_value = cached_params[key]
+        if value is cached_value:
+            continue
+        try:
+            if not bool(value == cached_value):
+                return False
+        except Exception:
+            # values that cannot be compared (e.g., arrays) are regarded as changed
+            return False
+    return True
+
+
+def _sample_actions(
+    preds: np.ndarray, alpha: float, n_actions: int, u1: np.ndarray, u2: np.ndarray
+) -> np.ndarray:
+    """Sample actions from a mixture of a deterministic policy and a uniform random policy.
+
+    Parameters
+    -----------
+    preds: array-like, shape (n_rounds,)
+        Actions chosen by the base deterministic policy.
+
+    alpha: float
+        Weight of the base deterministic policy in the mixture.
+
+    n_actions: int
+        Number of actions.
+
+    u1: array-like, shape (n_rounds,)
+        Uniform draws in [0, 1) deciding whether the deterministic policy is followed.
+
+    u2: array-like, shape (n_rounds,)
+        Uniform draws in [0, 1) used to sample a uniform random action.
+
+    Returns
+    ---------
+    action: array-like, shape (n_rounds,)
+        Sampled actions.
+
+    """
+    rand_action = np.minimum((u2 * n_actions).astype(np.int32), n_actions - 1)
+    return np.where(u1 < alpha, preds, rand_action).astype(int)
+
+
+@dataclass
+class _PolicyView:
+    """Implicit representation of a mixture of a deterministic policy and a uniform random policy.
+
+    Note
+    -------
+    Each row of the policy is a rank-1 perturbation of a constant vector, i.e.,
+    :math:`\\pi (a | x_i) = \\alpha \\cdot \\mathbb{I} \\{a = \\hat{a}_i \\} + (1.0 - \\alpha) / K`,
+    so it is stored with O(n_rounds) memory instead of a dense (n_rounds, n_actions) matrix.
+
+    Parameters
+    -----------
+    alpha: float
+        Weight of the base deterministic policy in the mixture.
+
+    preds: array-like, shape (n_rounds,)
+        Actions chosen by the base deterministic policy.
+
+    n_actions: int
+        Number of actions.
+
+    row_idx: array-like, shape (n_rounds,), default=None
+        Row indices, i.e., `np.arange(n_rounds)`, used to scatter the greedy mass in `to_dense`.
+        If None, it is built from `preds`; pass a precomputed one to avoid the allocation.
+
+    """
+
+    alpha: float
+    preds: np.ndarray
+    n_actions: int
+    row_idx: Optional[np.ndarray] = None
+
+    def __post_init__(self) -> None:
+        """Initialize Class."""
+        if self.row_idx is None:
+            self.row_idx = np.arange(self.preds.shape[0])
+
+    @property
+    def uniform_mass(self) -> float:
+        """Probability of choosing an action other than the one chosen by the base deterministic policy."""
+        return (1.0 - self.alpha) / self.n_actions
+
+    def gather(self, cols: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Probabilities of choosing actions `cols` in rounds `rows` (all rounds if None)."""
+        preds = self.preds if rows is None else self.preds[rows]
+        return np.where(
+            preds == cols, self.alpha + self.uniform_mass, self.uniform_mass
+        )
+
+    def row_sample(
+        self, random_: Union[np.random.RandomState, np.random.Generator]
+    ) -> np.ndarray:
+        """Sample an action for each round."""
+        n_rounds = self.preds.shape[0]
+        return _sample_actions(
+            preds=self.preds,
+            alpha=self.alpha,
+            n_actions=self.n_actions,
+            u1=random_.random(n_rounds),
+            u2=random_.random(n_rounds),
+        )
+
+    def to_dense(
+        self, dtype: type = np.float64, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Materialize the policy as a dense (n_rounds, n_actions) matrix (written into `out` if given)."""
+        if out is None:
+            out = np.empty((self.preds.shape[0], self.n_actions), dtype=dtype)
+        out[...] = self.uniform_mass
+        out[self.row_idx, self.preds] = self.alpha + self.uniform_mass
+        return out
+
+
 @dataclass
 class MultiClassToBanditReduction(BaseBanditDataset):
     """Class for handling multi-class classification data as logged bandit feedback data.
@@ -53,6 +184,7 @@ class MultiClassToBanditReduction(BaseBanditDataset):
     X: array-like, shape (n_rounds,n_features)
         Training vector of the original multi-class classification data,
         where n_rounds is the number of samples and n_features is the number of features.
+        It must be dense; `scipy.sparse` matrices are not supported.
 
     y: array-like, shape (n_rounds,)
         Target vector (relative to X) of the original multi-class classification data.
@@ -67,6 +199,10 @@ class MultiClassToBanditReduction(BaseBanditDataset):
     dataset_name: str, default=None
         Name of the dataset.
 
+    validate: bool, default=True
+        Whether to validate `X` and `y` with `sklearn.utils.check_X_y`.
+        Set False to skip the check (and its copy) when `X` and `y` are already clean numpy arrays.
+
     Examples
     ----------
 
@@ -105,10 +241,10 @@ class MultiClassToBanditReduction(BaseBanditDataset):
                     [ 0.,  1., 13., ...,  8., 11.,  1.],
                     [ 0.,  0., 15., ...,  0.,  0.,  0.],
                     [ 0.,  0.,  4., ..., 15.,  3.,  0.]]),
-            'action': array([6, 8, 5, ..., 2, 5, 9]),
-            'reward': array([1., 1., 1., ..., 1., 1., 1.]),
+            'action': array([...]),
+            'reward': array([...]),
             'position': None,
-            'pscore': array([0.82, 0.82, 0.82, ..., 0.82, 0.82, 0.82])
+            'pscore': array([...])
         }
 
         # obtain action choice probabilities by an evaluation policy and its ground-truth policy value
@@ -124,7 +260,7 @@ class MultiClassToBanditReduction(BaseBanditDataset):
         >>> ope = OffPolicyEvaluation(bandit_feedback=bandit_feedback, ope_estimators=[IPW()])
         >>> estimated_policy_value = ope.estimate_policy_values(action_dist=action_dist)
         >>> estimated_policy_value
-        {'ipw': 0.8662705029276045}
+        {'ipw': ...}
 
         # evaluate the estimation performance (accuracy) of IPW by relative estimation error (relative-ee)
         >>> relative_estimation_errors = ope.evaluate_performance_of_estimators(
@@ -132,7 +268,7 @@ class MultiClassToBanditReduction(BaseBanditDataset):
                 action_dist=action_dist,
             )
         >>> relative_estimation_errors
-        {'ipw': 0.000723881690137968}
+        {'ipw': ...}
 
     References
     ------------
@@ -146,6 +282,7 @@ class MultiClassToBanditReduction(BaseBanditDataset):
     base_classifier_b: ClassifierMixin
     alpha_b: float = 0.8
     dataset_name: Optional[str] = None
+    validate: bool = True
 
     def __post_init__(self) -> None:
         """Initialize Class."""
@@ -156,11 +293,35 @@ class MultiClassToBanditReduction(BaseBanditDataset):
                 f"alpha_b must be a float in the [0,1) interval, but {self.alpha_b} is given"
             )
 
-        self.X, y = check_X_y(X=self.X, y=self.y, ensure_2d=True, multi_output=False)
-        self.y = (rankdata(y, "dense") - 1).astype(int)  # re-index action
-        # fully observed labels
-        self.y_full = np.zeros((self.n_rounds, self.n_actions))
-        self.y_full[np.arange(self.n_rounds), y] = 1
+        if self.validate:
+            self.X, y = check_X_y(
+                X=self.X, y=self.y, ensure_2d=True, multi_output=False
+            )
+        else:
+            # only O(1) checks on the shapes are conducted
+            if issparse(self.X):
+                raise ValueError("X must be a dense np.ndarray when validate=False")
+            self.X, y = np.ascontiguousarray(self.X), np.asarray(self.y)
+            if self.X.ndim != 2:
+                raise ValueError(
+                    f"X must be 2-dimensional, but {self.X.ndim}-dimensional X is given"
+                )
+            if y.ndim != 1:
+                raise ValueError(
+                    f"y must be 1-dimensional, but {y.ndim}-dimensional y is given"
+                )
+            if self.X.shape[0] != y.shape[0]:
+                raise ValueError(
+                    "the sizes of axis 0 of X and y must be the same, "
+                    f"but {self.X.shape[0]} and {y.shape[0]} are given"
+                )
+        # re-index action (dense rank of the original labels)
+        uniq, self.y = np.unique(y, return_inverse=True)
+        self.y = self.y.astype(np.int32, copy=False)
+        self._n_actions = int(uniq.shape[0])
+        self._n_rounds = int(self.y.shape[0])
+        # fitted clone of base_classifier_b and its (lazily computed) predictions on the evaluation set
+        self._fit_cache: Optional[Dict[str, Any]] = None
 
     @property
     def len_list(self) -> int:
@@ -170,12 +331,12 @@ class MultiClassToBanditReduction(BaseBanditDataset):
     @property
     def n_actions(self) -> int:
         """Number of actions (number of classes)."""
-        return np.unique(self.y).shape[0]
+        return self._n_actions
 
     @property
     def n_rounds(self) -> int:
         """Number of samples in the original multi-class classification data."""
-        return self.y.shape[0]
+        return self._n_rounds
 
     def split_train_eval(
         self,
@@ -194,21 +355,114 @@ class MultiClassToBanditReduction(BaseBanditDataset):
             Controls the random seed in train-evaluation split.
 
         """
-        (
-            self.X_tr,
-            self.X_ev,
-            self.y_tr,
-            self.y_ev,
-            _,
-            self.y_full_ev,
-        ) = train_test_split(
-            self.X, self.y, self.y_full, test_size=eval_size, random_state=random_state
+        self.X_tr, self.X_ev, self.y_tr, self.y_ev = train_test_split(
+            self.X, self.y, test_size=eval_size, random_state=random_state
         )
         self.n_rounds_ev = self.X_ev.shape[0]
+        # row indices of the evaluation set (reused for fancy indexing)
+        self._row_idx_ev = np.arange(self.n_rounds_ev)
+        # the classifier fitted on the previous split is no longer valid
+        self._fit_cache = None
+        # contiguous copies passed to the base classifiers (no copy if already contiguous)
+        self._X_tr_c = np.ascontiguousarray(self.X_tr)
+        self._X_ev_c = np.ascontiguousarray(self.X_ev)
+
+    def _fit(self, base_classifier: ClassifierMixin) -> ClassifierMixin:
+        """Fit a clone of a given classifier on the training set.
+
+        Note
+        -------
+        The fit of `base_classifier_b` is cached (as long as its parameters are unchanged) until `self.split_train_eval()` is called again,
+        so `self.obtain_batch_bandit_feedback()` and `self.obtain_action_dist_by_eval_policy()` with `base_classifier_e=None`
+        fit it only once. Any other classifier is fitted on every call.
+
+        Parameters
+        -----------
+        base_classifier: ClassifierMixin
+            Machine learning classifier used to construct a policy.
+
+        Returns
+        ---------
+        base_clf: ClassifierMixin
+            Fitted clone of the given classifier.
+
+        """
+        is_base_classifier_b = base_classifier is self.base_classifier_b
+        if is_base_classifier_b:
+            # the classifier may have been replaced or its parameters changed by `set_params` since the cached fit
+            params = base_classifier.get_params(deep=True)
+            if (
+                self._fit_cache is not None
+                and self._fit_cache["base_classifier"] is base_classifier
+                and _is_same_params(params, self._fit_cache["params"])
+            ):
+                return self._fit_cache["base_clf"]
+        base_clf = clone(base_classifier)
+        base_clf.fit(X=self._X_tr_c, y=self.y_tr)
+        if is_base_classifier_b:
+            self._fit_cache = dict(
+                base_classifier=base_classifier,
+                params=params,
+                base_clf=base_clf,
+                preds=None,
+            )
+        return base_clf
+
+    def _fit_predict(self, base_classifier: ClassifierMixin) -> np.ndarray:
+        """Predict labels of the evaluation set by a (cached) fitted clone of a given classifier.
+
+        Parameters
+        -----------
+        base_classifier: ClassifierMixin
+            Machine learning classifier used to construct a policy.
+
+        Returns
+        ---------
+        preds: array-like, shape (n_rounds_ev,)
+            Labels of the evaluation set predicted by the fitted classifier.
+
+        """
+        base_clf = self._fit(base_classifier)
+        is_cached = (
+            self._fit_cache is not None and self._fit_cache["base_clf"] is base_clf
+        )
+        if is_cached and self._fit_cache["preds"] is not None:
+            return self._fit_cache["preds"]
+        preds = base_clf.predict(self._X_ev_c).astype(np.int32)
+        if is_cached:
+            self._fit_cache["preds"] = preds
+        return preds
+
+    def _fit_predict_proba(self, base_classifier: ClassifierMixin) -> np.ndarray:
+        """Predict class probabilities of the evaluation set by a (cached) fitted clone of a given classifier.
+
+        Parameters
+        -----------
+        base_classifier: ClassifierMixin
+            Machine learning classifier used to construct a policy.
+            It must implement `predict_proba`.
+
+        Returns
+        ---------
+        proba: array-like, shape (n_rounds_ev, n_actions)
+            Class probabilities of the evaluation set predicted by the fitted classifier.
+
+        """
+        base_clf = self._fit(base_classifier)
+        proba = base_clf.predict_proba(self._X_ev_c)
+        if proba.shape[1] != self.n_actions:
+            # some classes may be missing in the training set
+            proba_full = np.zeros((self.n_rounds_ev, self.n_actions))
+            proba_full[:, base_clf.classes_] = proba
+            proba = proba_full
+        return proba
 
     def obtain_batch_bandit_feedback(
         self,
-        random_state: Optional[int] = None,
+        random_state: Optional[
+            Union[int, np.random.RandomState, np.random.Generator]
+        ] = None,
+        use_proba: bool = False,
     ) -> BanditFeedback:
         """Obtain batch logged bandit feedback, an evaluation policy, and its ground-truth policy value.
 
@@ -218,8 +472,16 @@ class MultiClassToBanditReduction(BaseBanditDataset):
 
         Parameters
         -----------
-        random_state: int, default=None
+        random_state: int, RandomState or Generator, default=None
             Controls the random seed in sampling actions.
+            An int seeds a new `np.random.Generator` and a given `RandomState` or `Generator` is used as is.
+            If None, a fresh `np.random.Generator` seeded from OS entropy is used,
+            so (unlike the other modules of obp) `np.random.seed` does not make the sampling reproducible.
+
+        use_proba: bool, default=False
+            If True, the class probabilities predicted by `base_classifier_b` are used instead of its deterministic predictions,
+            i.e., :math:`\\pi_b (a | x) := \\alpha_b \\cdot \\hat{p} (a|x) + (1.0 - \\alpha_b) \\cdot \\pi_{u} (a|x)`.
+            `base_classifier_b` must implement `predict_proba`.
 
         Returns
         ---------
@@ -227,24 +489,52 @@ class MultiClassToBanditReduction(BaseBanditDataset):
             bandit_feedback is logged bandit feedback data generated from a multi-class classification dataset.
 
         """
-        random_ = check_random_state(random_state)
-        # train a base ML classifier
-        base_clf_b = clone(self.base_classifier_b)
-        base_clf_b.fit(X=self.X_tr, y=self.y_tr)
-        preds = base_clf_b.predict(self.X_ev).astype(int)
-        # construct a behavior policy
-        pi_b = np.zeros((self.n_rounds_ev, self.n_actions))
-        pi_b[:, :] = (1.0 - self.alpha_b) / self.n_actions
-        pi_b[np.arange(self.n_rounds_ev), preds] = (
-            self.alpha_b + (1.0 - self.alpha_b) / self.n_actions
+        random_ = _get_rng(random_state)
+        if use_proba:
+            if not hasattr(self.base_classifier_b, "predict_proba"):
+                raise ValueError(
+                    "base_classifier_b must implement predict_proba when use_proba=True"
+                )
+            return self._obtain_batch_bandit_feedback_by_proba(random_=random_)
+        # train a base ML classifier and construct a behavior policy
+        # (the behavior policy is a mixture of the base deterministic policy and a uniform random policy,
+        # so it is represented and sampled without constructing the (n_rounds_ev, n_actions) matrix)
+        pi_b = _PolicyView(
+            alpha=self.alpha_b,
+            preds=self._fit_predict(self.base_classifier_b),
+            n_actions=self.n_actions,
+            row_idx=self._row_idx_ev,
         )
         # sample action and factual reward based on the behavior policy
-        action = np.zeros(self.n_rounds_ev, dtype=int)
-        for i, p in enumerate(pi_b):
-            action[i] = random_.choice(
-                np.arange(self.n_actions, dtype=int), p=p, replace=False
-            )
-        reward = self.y_full_ev[np.arange(self.n_rounds_ev), action]
+        action = pi_b.row_sample(random_=random_)
+        # the reward is fully observed; it is 1 only when the sampled action is the true label
+        reward = (self.y_ev == action).astype(np.float64)
+        pscore = pi_b.gather(cols=action)
+
+        return dict(
+            n_actions=self.n_actions,
+            n_rounds=self.n_rounds_ev,
+            context=self.X_ev,
+            action=action,
+            reward=reward,
+            position=None,  # position effect is not considered in classification data
+            pscore=pscore,
+        )
+
+    def _obtain_batch_bandit_feedback_by_proba(
+        self, random_: Union[np.random.RandomState, np.random.Generator]
+    ) -> BanditFeedback:
+        """Obtain batch logged bandit feedback using the class probabilities predicted by the base classifier."""
+        # train a base ML classifier and construct a behavior policy
+        proba = self._fit_predict_proba(self.base_classifier_b)
+        pi_b = self.alpha_b * proba + (1.0 - self.alpha_b) / self.n_actions
+        # sample action and factual reward based on the behavior policy
+        # (vectorized inverse-CDF sampling; the first action whose cumulative mass exceeds a uniform draw)
+        cum_pi_b = np.cumsum(pi_b, axis=1)
+        cum_pi_b[:, -1] = 1.0  # guard against floating point errors in the cumulative sum
+        u = random_.random((self.n_rounds_ev, 1))
+        action = np.argmax(u < cum_pi_b, axis=1).astype(int)
+        reward = (self.y_ev == action).astype(np.float64)
 
         return dict(
             n_actions=self.n_actions,
@@ -253,11 +543,14 @@ class MultiClassToBanditReduction(BaseBanditDataset):
             action=action,
             reward=reward,
             position=None,  # position effect is not considered in classification data
-            pscore=pi_b[np.arange(self.n_rounds_ev), action],
+            pscore=pi_b[self._row_idx_ev, action],
         )
 
     def obtain_action_dist_by_eval_policy(
-        self, base_classifier_e: Optional[ClassifierMixin] = None, alpha_e: float = 1.0
+        self,
+        base_classifier_e: Optional[ClassifierMixin] = None,
+        alpha_e: float = 1.0,
+        dtype: type = np.float32,
     ) -> np.ndarray:
         """Obtain action choice probabilities by an evaluation policy.
 
@@ -270,6 +563,9 @@ class MultiClassToBanditReduction(BaseBanditDataset):
             Ration of a uniform random policy when constructing an **evaluation** policy.
             Must be in the [0, 1] interval (evaluation policy can be deterministic).
 
+        dtype: type, default=np.float32
+            Data type of the returned action choice probabilities.
+
         Returns
         ---------
         action_dist_by_eval_policy: array-like, shape (n_rounds_ev, n_actions, 1)
@@ -285,23 +581,79 @@ class MultiClassToBanditReduction(BaseBanditDataset):
             )
         # train a base ML classifier
         if base_classifier_e is None:
-            base_clf_e = clone(self.base_classifier_b)
+            base_classifier_e = self.base_classifier_b
         else:
             assert is_classifier(
                 base_classifier_e
             ), f"base_classifier_e must be a classifier"
-            base_clf_e = clone(base_classifier_e)
-        base_clf_e.fit(X=self.X_tr, y=self.y_tr)
-        preds = base_clf_e.predict(self.X_ev).astype(int)
         # construct an evaluation policy
-        pi_e = np.zeros((self.n_rounds_ev, self.n_actions))
-        pi_e[:, :] = (1.0 - alpha_e) / self.n_actions
-        pi_e[np.arange(self.n_rounds_ev), preds] = (
-            alpha_e + (1.0 - alpha_e) / self.n_actions
+        pi_e = _PolicyView(
+            alpha=alpha_e,
+            preds=self._fit_predict(base_classifier_e),
+            n_actions=self.n_actions,
+            row_idx=self._row_idx_ev,
+        ).to_dense(dtype=dtype)
+        return pi_e.reshape(self.n_rounds_ev, self.n_actions, 1)
+
+    def obtain_action_dist_batch(
+        self,
+        alphas: np.ndarray,
+        base_classifier_e: Optional[ClassifierMixin] = None,
+        dtype: type = np.float32,
+    ) -> np.ndarray:
+        """Obtain action choice probabilities by evaluation policies with multiple values of alpha_e.
+
+        Note
+        -------
+        The base classifier is fitted only once and shared by all the evaluation policies.
+
+        Parameters
+        -----------
+        alphas: array-like, shape (n_alphas,)
+            Values of alpha_e used to construct **evaluation** policies.
+            Each value must be in the [0, 1] interval (evaluation policy can be deterministic).
+
+        base_classifier_e: ClassifierMixin, default=None
+            Machine learning classifier used to construct evaluation policies.
+
+        dtype: type, default=np.float32
+            Data type of the returned action choice probabilities.
+
+        Returns
+        ---------
+        action_dist_batch: array-like, shape (n_alphas, n_rounds_ev, n_actions, 1)
+            action_dist_batch[i] is the action choice probabilities by an evaluation policy with alpha_e=alphas[i].
+
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        if alphas.ndim != 1 or not np.all((0.0 <= alphas) & (alphas <= 1.0)):
+            raise ValueError(
+                f"alphas must be a 1-D array of floats in the [0,1] interval, but {alphas} is given"
+            )
+        # train a base ML classifier
+        if base_classifier_e is None:
+            base_classifier_e = self.base_classifier_b
+        else:
+            assert is_classifier(
+                base_classifier_e
+            ), f"base_classifier_e must be a classifier"
+        preds = self._fit_predict(base_classifier_e)
+        # construct evaluation policies (written in place into a single allocation)
+        pi_e_batch = np.empty(
+            (alphas.shape[0], self.n_rounds_ev, self.n_actions), dtype=dtype
+        )
+        for alpha_e, pi_e in zip(alphas, pi_e_batch):
+            _PolicyView(
+                alpha=float(alpha_e),
+                preds=preds,
+                n_actions=self.n_actions,
+                row_idx=self._row_idx_ev,
+            ).to_dense(out=pi_e)
+        return pi_e_batch.reshape(
+            alphas.shape[0], self.n_rounds_ev, self.n_actions, 1
         )
-        return np.expand_dims(pi_e, 2)
 
-    def calc_ground_truth_policy_value(self, action_dist: np.ndarray) -> np.ndarray:
+    def calc_ground_truth_policy_value(self, action_dist: np.ndarray) -> float:
         """Calculate the ground-truth policy value of a given action distribution.
 
         Parameters
@@ -324,4 +676,6 @@ class MultiClassToBanditReduction(BaseBanditDataset):
             raise ValueError(
                 "the size of axis 0 of action_dist must be the same as the number of samples in the evaluation set"
             )
-        return action_dist[np.arange(self.n_rounds_ev), self.y_ev].mean()
+        return float(
+            np.take_along_axis(action_dist, self.y_ev[:, None, None], axis=1).mean()
+        )
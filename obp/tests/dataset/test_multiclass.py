@@ -6,6 +6,7 @@ from sklearn.linear_model import LogisticRegression
 from typing import Tuple
 
 from obp.dataset import MultiClassToBanditReduction
+from obp.dataset.multiclass import _PolicyView
 
 
 @pytest.fixture(scope="session")
@@ -14,6 +15,45 @@ def raw_data() -> Tuple[np.ndarray, np.ndarray]:
     return X, y
 
 
+def test_policy_view():
+    alpha, n_actions = 0.6, 4
+    preds = np.array([0, 3, 1, 3, 2], dtype=np.int32)
+    pi = _PolicyView(alpha=alpha, preds=preds, n_actions=n_actions)
+
+    # dense matrix of the mixture policy
+    dense = pi.to_dense()
+    expected = np.full((preds.shape[0], n_actions), (1.0 - alpha) / n_actions)
+    expected[np.arange(preds.shape[0]), preds] += alpha
+    np.testing.assert_allclose(dense, expected)
+    np.testing.assert_allclose(dense.sum(1), 1.0)
+    assert pi.to_dense(dtype=np.float32).dtype == np.float32
+
+    # the precomputed row index gives the same matrix
+    pi_with_row_idx = _PolicyView(
+        alpha=alpha, preds=preds, n_actions=n_actions, row_idx=np.arange(5)
+    )
+    np.testing.assert_allclose(pi_with_row_idx.to_dense(), expected)
+
+    # writing into a given array
+    out = np.zeros((preds.shape[0], n_actions))
+    assert pi.to_dense(out=out) is out
+    np.testing.assert_allclose(out, expected)
+
+    # gather over all rounds and over a subset of rounds
+    cols = np.array([0, 0, 1, 3, 3])
+    np.testing.assert_allclose(pi.gather(cols=cols), expected[np.arange(5), cols])
+    rows = np.array([4, 1])
+    np.testing.assert_allclose(
+        pi.gather(cols=np.array([2, 0]), rows=rows), expected[rows, [2, 0]]
+    )
+
+    # sampled actions are valid
+    action = pi.row_sample(random_=np.random.default_rng(12345))
+    assert action.shape == preds.shape
+    assert action.dtype == int
+    assert np.all((0 <= action) & (action < n_actions))
+
+
 def test_invalid_initialization(raw_data):
     X, y = raw_data
 
@@ -35,6 +75,40 @@ def test_invalid_initialization(raw_data):
         MultiClassToBanditReduction(X=X, y=y, base_classifier_b=DecisionTreeRegressor)
 
 
+def test_initialization_without_validation(raw_data):
+    X, y = raw_data
+
+    mcbr = MultiClassToBanditReduction(
+        X=X, y=y, base_classifier_b=LogisticRegression(), alpha_b=0.3, validate=False
+    )
+
+    assert mcbr.n_rounds == X.shape[0]
+    assert mcbr.n_actions == np.unique(y).shape[0]
+
+    # sparse X
+    with pytest.raises(ValueError):
+        from scipy.sparse import csr_matrix
+
+        MultiClassToBanditReduction(
+            X=csr_matrix(X),
+            y=y,
+            base_classifier_b=LogisticRegression(),
+            validate=False,
+        )
+
+    # 1-dimensional X
+    with pytest.raises(ValueError):
+        MultiClassToBanditReduction(
+            X=X[:, 0], y=y, base_classifier_b=LogisticRegression(), validate=False
+        )
+
+    # X and y of different sizes
+    with pytest.raises(ValueError):
+        MultiClassToBanditReduction(
+            X=X[:-1], y=y, base_classifier_b=LogisticRegression(), validate=False
+        )
+
+
 def test_split_train_eval(raw_data):
     X, y = raw_data
 
@@ -64,6 +138,150 @@ def test_obtain_batch_bandit_feedback(raw_data):
     assert "position" in bandit_feedback.keys()
     assert "pscore" in bandit_feedback.keys()
 
+    # actions must be int to pass the input checks of the OPE estimators
+    assert bandit_feedback["action"].dtype == int
+    # while labels and predictions are stored as int32
+    assert mcbr.y.dtype == np.int32
+    assert mcbr.y_ev.dtype == np.int32
+    assert mcbr._fit_predict(mcbr.base_classifier_b).dtype == np.int32
+
+    # pscore takes the greedy mass only when the sampled action is the base prediction
+    alpha_b, n_actions = 0.3, mcbr.n_actions
+    preds = LogisticRegression().fit(mcbr.X_tr, mcbr.y_tr).predict(mcbr.X_ev)
+    is_greedy = bandit_feedback["action"] == preds
+    np.testing.assert_allclose(
+        bandit_feedback["pscore"],
+        np.where(
+            is_greedy,
+            alpha_b + (1.0 - alpha_b) / n_actions,
+            (1.0 - alpha_b) / n_actions,
+        ),
+    )
+
+    # empirical rate of choosing the base prediction (pooled over many samples)
+    is_greedy = np.concatenate(
+        [
+            mcbr.obtain_batch_bandit_feedback(random_state=random_state)["action"]
+            == preds
+            for random_state in range(50)
+        ]
+    )
+    assert np.abs(is_greedy.mean() - (alpha_b + (1.0 - alpha_b) / n_actions)) < 0.02
+
+    # the same random_state gives the same actions
+    np.testing.assert_array_equal(
+        mcbr.obtain_batch_bandit_feedback(random_state=12345)["action"],
+        mcbr.obtain_batch_bandit_feedback(random_state=12345)["action"],
+    )
+
+    # a given Generator or RandomState is used (and advanced) as is
+    for make_rng in [np.random.default_rng, np.random.RandomState]:
+        random_ = make_rng(12345)
+        np.testing.assert_array_equal(
+            mcbr.obtain_batch_bandit_feedback(random_state=random_)["action"],
+            mcbr.obtain_batch_bandit_feedback(random_state=make_rng(12345))["action"],
+        )
+        assert random_.random() != make_rng(12345).random()
+
+    # behavior policy constructed from predicted class probabilities
+    bandit_feedback = mcbr.obtain_batch_bandit_feedback(use_proba=True)
+    assert bandit_feedback["action"].dtype == int
+    proba = LogisticRegression().fit(mcbr.X_tr, mcbr.y_tr).predict_proba(mcbr.X_ev)
+    pi_b = alpha_b * proba + (1.0 - alpha_b) / n_actions
+    np.testing.assert_allclose(
+        bandit_feedback["pscore"],
+        pi_b[np.arange(mcbr.n_rounds_ev), bandit_feedback["action"]],
+    )
+
+    # empirical action frequencies (pooled over many samples)
+    action = np.concatenate(
+        [
+            mcbr.obtain_batch_bandit_feedback(
+                random_state=random_state, use_proba=True
+            )["action"]
+            for random_state in range(50)
+        ]
+    )
+    action_freq = np.bincount(action, minlength=n_actions) / action.shape[0]
+    np.testing.assert_allclose(action_freq, pi_b.mean(0), atol=0.02)
+
+    # classifier without predict_proba
+    with pytest.raises(ValueError):
+        from sklearn.svm import LinearSVC
+
+        MultiClassToBanditReduction(
+            X=X, y=y, base_classifier_b=LinearSVC(), alpha_b=0.3
+        ).obtain_batch_bandit_feedback(use_proba=True)
+
+
+class CountingLogisticRegression(LogisticRegression):
+    """LogisticRegression counting the number of calls of `fit` (over all of its clones)."""
+
+    n_fit = 0
+
+    def fit(self, X, y, sample_weight=None):
+        CountingLogisticRegression.n_fit += 1
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+def test_fit_cache(raw_data):
+    X, y = raw_data
+
+    CountingLogisticRegression.n_fit = 0
+    mcbr = MultiClassToBanditReduction(
+        X=X, y=y, base_classifier_b=CountingLogisticRegression(), alpha_b=0.3
+    )
+    mcbr.split_train_eval()
+
+    # the fit of base_classifier_b is reused by both obtain_* methods
+    mcbr.obtain_batch_bandit_feedback()
+    mcbr.obtain_action_dist_by_eval_policy()
+    assert CountingLogisticRegression.n_fit == 1
+
+    # the cache is cleared by split_train_eval
+    mcbr.split_train_eval()
+    mcbr.obtain_action_dist_by_eval_policy()
+    assert CountingLogisticRegression.n_fit == 2
+
+    # base_classifier_b is refitted after its parameters are changed
+    mcbr.base_classifier_b.set_params(C=100)
+    mcbr.obtain_action_dist_by_eval_policy()
+    assert CountingLogisticRegression.n_fit == 3
+    mcbr.obtain_batch_bandit_feedback()
+    assert CountingLogisticRegression.n_fit == 3
+
+    # other classifiers are not cached
+    base_classifier_e = CountingLogisticRegression(C=10)
+    mcbr.obtain_action_dist_by_eval_policy(base_classifier_e=base_classifier_e)
+    mcbr.obtain_action_dist_by_eval_policy(base_classifier_e=base_classifier_e)
+    assert CountingLogisticRegression.n_fit == 5
+
+
+def test_fit_cache_with_unpicklable_params(raw_data):
+    X, y = raw_data
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import FunctionTransformer
+
+    CountingLogisticRegression.n_fit = 0
+    pipeline = Pipeline(
+        [
+            ("scale", FunctionTransformer(lambda x: x / 16.0)),
+            ("clf", CountingLogisticRegression()),
+        ]
+    )
+    mcbr = MultiClassToBanditReduction(
+        X=X, y=y, base_classifier_b=pipeline, alpha_b=0.3
+    )
+    mcbr.split_train_eval()
+
+    mcbr.obtain_batch_bandit_feedback()
+    mcbr.obtain_action_dist_by_eval_policy()
+    assert CountingLogisticRegression.n_fit == 1
+
+    mcbr.base_classifier_b.set_params(clf__C=100)
+    mcbr.obtain_action_dist_by_eval_policy()
+    assert CountingLogisticRegression.n_fit == 2
+
 
 def test_obtain_action_dist_by_eval_policy(raw_data):
     X, y = raw_data
@@ -88,6 +306,39 @@ def test_obtain_action_dist_by_eval_policy(raw_data):
     n_actions = np.unique(y).shape[0]
     assert action_dist.shape[1] == n_actions
     assert action_dist.shape[2] == 1
+    assert action_dist.dtype == np.float32
+
+    action_dist = mcbr.obtain_action_dist_by_eval_policy(dtype=np.float64)
+    assert action_dist.dtype == np.float64
+
+
+def test_obtain_action_dist_batch(raw_data):
+    X, y = raw_data
+
+    eval_size = 1000
+    mcbr = MultiClassToBanditReduction(
+        X=X, y=y, base_classifier_b=LogisticRegression(), alpha_b=0.3
+    )
+    mcbr.split_train_eval(eval_size=eval_size)
+
+    # invalid alphas
+    with pytest.raises(ValueError):
+        mcbr.obtain_action_dist_batch(alphas=np.array([0.5, 1.3]))
+
+    with pytest.raises(ValueError):
+        mcbr.obtain_action_dist_batch(alphas=np.array([[0.5]]))
+
+    alphas = np.array([0.0, 0.5, 1.0])
+    action_dist_batch = mcbr.obtain_action_dist_batch(alphas=alphas)
+
+    n_actions = np.unique(y).shape[0]
+    assert action_dist_batch.shape == (alphas.shape[0], eval_size, n_actions, 1)
+    for i, alpha_e in enumerate(alphas):
+        np.testing.assert_allclose(
+            action_dist_batch[i],
+            mcbr.obtain_action_dist_by_eval_policy(alpha_e=alpha_e),
+            rtol=1e-6,
+        )
 
 
 def test_calc_ground_truth_policy_value(raw_data):
@@ -114,3 +365,12 @@ def test_calc_ground_truth_policy_value(raw_data):
         action_dist=action_dist
     )
     assert isinstance(ground_truth_policy_value, float)
+
+    # the probabilities of the true labels are averaged over every position
+    action_dist_two_positions = np.concatenate(
+        [action_dist, np.zeros_like(action_dist)], axis=2
+    )
+    assert np.isclose(
+        mcbr.calc_ground_truth_policy_value(action_dist=action_dist_two_positions),
+        ground_truth_policy_value / 2,
+    )
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 from sklearn.linear_model import LogisticRegression
 # import open bandit pipeline (obp)
 from obp import obp
@@ -11,77 +13,87 @@ from obp.obp.ope import (
     DoublyRobust
 )
 
-# Dataset
-dataset = OpenBanditDataset(behavior_policy='random', campaign='all')
+if __name__ == "__main__":
+    # Dataset
+    dataset = OpenBanditDataset(behavior_policy='random', campaign='all')
 
-# obtain logged bandit feedback generated by behavior policy
-bandit_feedback = dataset.obtain_batch_bandit_feedback()
-time_bandit = dataset.obtain_batch_bandit_feedback(is_timeseries_split=True)
+    # obtain logged bandit feedback generated by behavior policy
+    bandit_feedback = dataset.obtain_batch_bandit_feedback()
+    time_bandit = dataset.obtain_batch_bandit_feedback(is_timeseries_split=True)
 
-# Policy
-evaluation_policy = BernoulliTS(
-    n_actions=dataset.n_actions,
-    len_list=dataset.len_list,
-    is_zozotown_prior=True,  # replicate the BernoulliTS policy in the ZOZOTOWN production
-    campaign="all",
-    random_state=12345,
-)
+    # Policy
+    evaluation_policy = BernoulliTS(
+        n_actions=dataset.n_actions,
+        len_list=dataset.len_list,
+        is_zozotown_prior=True,  # replicate the BernoulliTS policy in the ZOZOTOWN production
+        campaign="all",
+        random_state=12345,
+    )
 
-action_dist = evaluation_policy.compute_batch_action_dist(
-    n_sim=100000, n_rounds=bandit_feedback["n_rounds"],
-)
+    # the Thompson sampling simulation does not depend on the regression model below,
+    # so it runs in a separate process while the regression model is cross-fitted
+    # (`compute_batch_action_dist` is a pure-python loop holding the GIL, so a thread would not overlap)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        action_dist_future = executor.submit(
+            evaluation_policy.compute_batch_action_dist,
+            n_sim=100000,
+            n_rounds=bandit_feedback["n_rounds"],
+        )
 
-# OPE
-# estimate the mean reward function by using an ML model (Logistic Regression here)
-# the estimated rewards are used by model-dependent estimators such as DM and DR
-regression_model = RegressionModel(
-    n_actions=dataset.n_actions,
-    len_list=dataset.len_list,
-    action_context=dataset.action_context,
-    base_model=LogisticRegression(random_state=12345),
-)
+        # OPE
+        # estimate the mean reward function by using an ML model (Logistic Regression here)
+        # the estimated rewards are used by model-dependent estimators such as DM and DR
+        regression_model = RegressionModel(
+            n_actions=dataset.n_actions,
+            len_list=dataset.len_list,
+            action_context=dataset.action_context,
+            base_model=LogisticRegression(random_state=12345),
+        )
 
-# please refer to https://arxiv.org/abs/2002.08536 about the details of the cross-fitting procedure.
-estimated_rewards_by_reg_model = regression_model.fit_predict(
-    context=bandit_feedback["context"],
-    action=bandit_feedback["action"],
-    reward=bandit_feedback["reward"],
-    position=bandit_feedback["position"],
-    pscore=bandit_feedback["pscore"],
-    n_folds=3,  # use 3-fold cross-fitting
-    random_state=12345,
-)
+        # please refer to https://arxiv.org/abs/2002.08536 about the details of the cross-fitting procedure.
+        estimated_rewards_by_reg_model = regression_model.fit_predict(
+            context=bandit_feedback["context"],
+            action=bandit_feedback["action"],
+            reward=bandit_feedback["reward"],
+            position=bandit_feedback["position"],
+            pscore=bandit_feedback["pscore"],
+            n_folds=3,  # use 3-fold cross-fitting
+            random_state=12345,
+        )
 
-# estimate the policy value of BernoulliTS based on its action choice probabilities
-# it is possible to set multiple OPE estimators to the `ope_estimators` argument
-ope = OffPolicyEvaluation(
-    bandit_feedback=bandit_feedback,
-    ope_estimators=[InverseProbabilityWeighting(), DirectMethod(), DoublyRobust()]
-)
+        # wait for the action choice probabilities of BernoulliTS
+        action_dist = action_dist_future.result()
 
-# `summarize_off_policy_estimates` returns pandas dataframes including the OPE results
-estimated_policy_value, estimated_interval = ope.summarize_off_policy_estimates(
-    action_dist=action_dist,
-    estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
-    n_bootstrap_samples=10000,  # number of resampling performed in the bootstrap procedure.
-    random_state=12345,
-)
+    # estimate the policy value of BernoulliTS based on its action choice probabilities
+    # it is possible to set multiple OPE estimators to the `ope_estimators` argument
+    ope = OffPolicyEvaluation(
+        bandit_feedback=bandit_feedback,
+        ope_estimators=[InverseProbabilityWeighting(), DirectMethod(), DoublyRobust()]
+    )
 
-# Evaluation of OPE
+    # `summarize_off_policy_estimates` returns pandas dataframes including the OPE results
+    estimated_policy_value, estimated_interval = ope.summarize_off_policy_estimates(
+        action_dist=action_dist,
+        estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+        n_bootstrap_samples=10000,  # number of resampling performed in the bootstrap procedure.
+        random_state=12345,
+    )
 
-# we first calculate the ground-truth policy value of the evaluation policy
-# , which is estimated by averaging the factual (observed) rewards contained in the dataset (on-policy estimation)
-policy_value_bts = OpenBanditDataset.calc_on_policy_policy_value_estimate(
-    behavior_policy='bts', campaign='all'
-)
+    # Evaluation of OPE
 
-# evaluate the estimation performances of OPE estimators
-# by comparing the estimated policy values of BernoulliTS and its ground-truth.
-# `evaluate_performance_of_estimators` returns a dictionary containing estimation performances of given estimators
-relative_ee = ope.summarize_estimators_comparison(
-    ground_truth_policy_value=policy_value_bts,
-    action_dist=action_dist,
-    estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
-    metric="relative-ee",  # "relative-ee" (relative estimation error) or "se" (squared error)
-)
+    # we first calculate the ground-truth policy value of the evaluation policy
+    # , which is estimated by averaging the factual (observed) rewards contained in the dataset (on-policy estimation)
+    policy_value_bts = OpenBanditDataset.calc_on_policy_policy_value_estimate(
+        behavior_policy='bts', campaign='all'
+    )
+
+    # evaluate the estimation performances of OPE estimators
+    # by comparing the estimated policy values of BernoulliTS and its ground-truth.
+    # `evaluate_performance_of_estimators` returns a dictionary containing estimation performances of given estimators
+    relative_ee = ope.summarize_estimators_comparison(
+        ground_truth_policy_value=policy_value_bts,
+        action_dist=action_dist,
+        estimated_rewards_by_reg_model=estimated_rewards_by_reg_model,
+        metric="relative-ee",  # "relative-ee" (relative estimation error) or "se" (squared error)
+    )
 